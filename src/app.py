@@ -7,14 +7,16 @@ for extracurricular activities at Mergington High School.
 
 from ast import Add
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 import os
 from pathlib import Path
 
 app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
+              description="API for viewing and signing up for extracurricular activities",
+              default_response_class=ORJSONResponse)
 
 # Mount the static files directory
 current_dir = Path(__file__).parent
@@ -55,6 +57,18 @@ activities = {
     }
 }
 
+# Cached orjson serialization of the activities dict, so repeated GETs serve
+# precomputed bytes; rebuilt lazily after any mutation since the store is a
+# plain module-level dict
+_activities_json = None
+
+
+def _invalidate_activities_cache():
+    """Drop the cached /activities bytes after the store is mutated"""
+    global _activities_json
+    _activities_json = None
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
@@ -62,7 +76,13 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Returning the response directly skips FastAPI's field validation and
+    # jsonable_encoder pass; the serialized bytes are cached between
+    # mutations, so steady-state reads skip the orjson dump as well
+    global _activities_json
+    if _activities_json is None:
+        _activities_json = orjson.dumps(activities)
+    return Response(content=_activities_json, media_type="application/json")
 
 
 @app.get("/activities/{activity_name}")
@@ -89,8 +109,11 @@ def signup_for_activity(activity_name: str, email: str):
     if email in activity["participants"]:
      raise HTTPException(status_code=400, detail="Student is already signed up")
 
-    # Add student
+    # Add student and return the updated activity so clients don't need a
+    # follow-up GET to observe the new participant list
     activity["participants"].append(email) # type: ignore
+    _invalidate_activities_cache()
+    return {"activity": activity_name, "participants": activity["participants"]}
 
 
 @app.delete("/activities/{activity_name}/unregister")
@@ -109,4 +132,5 @@ def unregister_from_activity(activity_name: str, email: str):
 
     # Remove student
     activity["participants"].remove(email)
+    _invalidate_activities_cache()
     return {"message": "Successfully unregistered from activity"}
@@ -5,214 +5,130 @@ This module tests the GET /activities endpoint which retrieves
 all available activities and their details.
 """
 
+import asyncio
+
 import pytest
 
+# Fields every activity must expose; built once so the parametrized
+# invariant test doesn't re-materialize the set per activity
+REQUIRED_FIELDS = frozenset(
+    ("description", "schedule", "max_participants", "participants")
+)
+
 
 class TestActivitiesEndpoint:
     """Test suite for the /activities GET endpoint"""
     
-    def test_activities_endpoint_returns_200(self, test_client):
+    def test_activities_endpoint_contract(self, test_client):
         """
-        Test that /activities returns HTTP 200 OK
-        
+        Test the basic /activities response contract with one request
+
         Validates:
-        - The endpoint is accessible
-        - The request is successful
-        - No server errors occur
+        - The endpoint is accessible and returns HTTP 200
+        - Response is a dictionary keyed by activity name (not a list)
+        - At least one activity exists for students to join
         """
         # Arrange: No setup needed - endpoint is always available
-        
-        # Act: Make a GET request to the activities endpoint
-        response = test_client.get("/activities")
-        
-        # Assert: Verify HTTP 200 response
-        assert response.status_code == 200
-    
-    def test_activities_endpoint_returns_dict(self, test_client):
-        """
-        Test that /activities returns data as a dictionary (object)
-        
-        Validates:
-        - Response is not a list or array
-        - Activities are keyed by name (not in array form)
-        - Data structure matches API contract
-        """
-        # Arrange: No setup needed
-        
-        # Act: Make the request and get JSON data
+
+        # Act: Make a single GET request to the activities endpoint
         response = test_client.get("/activities")
         data = response.json()
-        
-        # Assert: Verify response is a dictionary
+
+        # Assert: Verify status, structure, and content together
+        assert response.status_code == 200
         assert isinstance(data, dict)
+        assert not isinstance(data, list)
+        assert len(data) > 0
     
-    def test_activities_endpoint_has_content(self, test_client):
-        """
-        Test that /activities returns at least one activity
-        
-        Validates:
-        - Database is not empty
-        - Endpoint returns meaningful data
-        - Activities exist for students to join
-        """
-        # Arrange: No setup needed
-        
-        # Act: Get activities from API
-        response = test_client.get("/activities")
-        activities = response.json()
-        
-        # Assert: Verify activities dictionary is not empty
-        assert len(activities) > 0
-    
-    def test_each_activity_has_name(self, available_activities):
-        """
-        Test that each activity has a non-empty name/key
-        
-        Validates:
-        - Activity names are valid identifiers
-        - Activity names are not empty strings
-        - Activity dictionary has proper structure
-        """
-        # Arrange: Get available activities fixture
-        
-        # Act & Assert: Iterate through all activities and validate names
-        for activity_name in available_activities.keys():
-            assert isinstance(activity_name, str)
-            assert len(activity_name) > 0
-    
-    def test_each_activity_has_all_fields(self, available_activities):
-        """
-        Test that each activity contains all required fields
-        
-        Validates:
-        - Required fields: description, schedule, max_participants, participants
-        - No missing fields
-        - API contract is maintained
-        - Clients can rely on consistent structure
+    def test_activity_field_invariants(self, activity_detail):
         """
-        # Arrange: Define the fields every activity must have
-        required_fields = {
-            "description",
-            "schedule",
-            "max_participants",
-            "participants"
-        }
-        
-        # Act & Assert: Check each activity
-        for activity_name, details in available_activities.items():
-            actual_fields = set(details.keys())
-            assert actual_fields == required_fields, \
-                f"Activity '{activity_name}' has fields {actual_fields}, " \
-                f"expected {required_fields}"
-    
-    def test_description_field_is_string(self, available_activities):
-        """
-        Test that description field contains a non-empty string
-        
-        Validates:
-        - Description exists and is a string
-        - Description is not empty
-        - Students get meaningful activity descriptions
-        """
-        # Arrange: Get activities fixture
-        
-        # Act & Assert: Check description for each activity
-        for activity_name, details in available_activities.items():
-            description = details["description"]
-            assert isinstance(description, str), \
-                f"Activity '{activity_name}' description is not a string"
-            assert len(description) > 0, \
-                f"Activity '{activity_name}' description is empty"
-    
-    def test_schedule_field_is_string(self, available_activities):
-        """
-        Test that schedule field contains a non-empty string
-        
-        Validates:
-        - Schedule exists and is a string
-        - Schedule is not empty
-        - Students get meeting time information
-        """
-        # Arrange: Get activities fixture
-        
-        # Act & Assert: Check schedule for each activity
-        for activity_name, details in available_activities.items():
-            schedule = details["schedule"]
-            assert isinstance(schedule, str), \
-                f"Activity '{activity_name}' schedule is not a string"
-            assert len(schedule) > 0, \
-                f"Activity '{activity_name}' schedule is empty"
-    
-    def test_max_participants_is_positive_integer(self, available_activities):
-        """
-        Test that max_participants is a valid positive integer
-        
-        Validates:
-        - max_participants is an integer (not float or string)
-        - max_participants is positive (capacity > 0)
-        - Activity capacity makes sense
-        """
-        # Arrange: Get activities fixture
-        
-        # Act & Assert: Check max_participants for each activity
-        for activity_name, details in available_activities.items():
-            max_participants = details["max_participants"]
-            assert isinstance(max_participants, int), \
-                f"Activity '{activity_name}' max_participants is not an integer"
-            assert max_participants > 0, \
-                f"Activity '{activity_name}' max_participants is not positive"
-    
-    def test_participants_is_list(self, available_activities):
-        """
-        Test that participants field is a list
-        
-        Validates:
-        - participants is a list (can be empty or contain emails)
-        - participants can hold multiple entries
-        - Data structure supports student roster
-        """
-        # Arrange: Get activities fixture
-        
-        # Act & Assert: Check participants for each activity
-        for activity_name, details in available_activities.items():
-            participants = details["participants"]
-            assert isinstance(participants, list), \
-                f"Activity '{activity_name}' participants is not a list"
-    
-    def test_participants_are_strings(self, available_activities):
-        """
-        Test that each participant entry is a string (email address)
-        
+        Test every field invariant for a single activity
+
+        This test is parametrized per activity via pytest_generate_tests in
+        conftest.py, so each activity gets its own test id and failures point
+        at the exact offending activity.
+
         Validates:
-        - Every participant is a string
-        - Likely to be email addresses
-        - No invalid data types mixed in participants list
-        """
-        # Arrange: Get activities fixture
-        
-        # Act & Assert: Check each participant in each activity
-        for activity_name, details in available_activities.items():
-            participants = details["participants"]
-            for participant in participants:
-                assert isinstance(participant, str), \
-                    f"Activity '{activity_name}' has non-string participant: {participant}"
-    
-    def test_participant_count_not_exceeds_max(self, available_activities):
+        - Activity name/key is a non-empty string
+        - Exactly the required fields are present (description, schedule,
+          max_participants, participants)
+        - description and schedule are non-empty strings
+        - max_participants is a positive integer
+        - participants is a list of strings
+        - Current participant count never exceeds max capacity
+        """
+        # Arrange: Unpack the parametrized activity
+        activity_name, details = activity_detail
+
+        # Act & Assert: Check all invariants for this activity
+        assert isinstance(activity_name, str)
+        assert len(activity_name) > 0
+
+        # dict_keys compares against a frozenset as a set, no copy needed
+        assert details.keys() == REQUIRED_FIELDS, \
+            f"Activity '{activity_name}' has fields {set(details.keys())}, " \
+            f"expected {set(REQUIRED_FIELDS)}"
+
+        description = details["description"]
+        assert isinstance(description, str), \
+            f"Activity '{activity_name}' description is not a string"
+        assert len(description) > 0, \
+            f"Activity '{activity_name}' description is empty"
+
+        schedule = details["schedule"]
+        assert isinstance(schedule, str), \
+            f"Activity '{activity_name}' schedule is not a string"
+        assert len(schedule) > 0, \
+            f"Activity '{activity_name}' schedule is empty"
+
+        max_participants = details["max_participants"]
+        assert isinstance(max_participants, int), \
+            f"Activity '{activity_name}' max_participants is not an integer"
+        assert max_participants > 0, \
+            f"Activity '{activity_name}' max_participants is not positive"
+
+        participants = details["participants"]
+        assert isinstance(participants, list), \
+            f"Activity '{activity_name}' participants is not a list"
+        # Single all() over a generator keeps the element walk in C instead
+        # of one Python-level assert per participant
+        assert all(isinstance(p, str) for p in participants), \
+            f"Activity '{activity_name}' has non-string participants: " \
+            f"{[p for p in participants if not isinstance(p, str)]}"
+
+        assert len(participants) <= max_participants, \
+            f"Activity '{activity_name}' has {len(participants)} participants " \
+            f"but max is {max_participants}"
+
+
+class TestActivitiesConcurrentReads:
+    """Test suite for concurrent access to the read-only endpoints"""
+
+    async def test_concurrent_activity_reads(self, async_test_client,
+                                              available_activities):
         """
-        Test that current participants don't exceed max capacity
-        
+        Test that concurrent reads all succeed and agree with each other
+
+        Dispatches one GET per activity plus the full listing through the
+        async client in a single asyncio.gather, so the independent reads
+        share the event loop instead of running serially.
+
         Validates:
-        - Data consistency (no overbooking)
-        - max_participants is a real limit
-        - Database integrity rules are enforced
+        - The listing and every per-activity endpoint return HTTP 200
+        - Each per-activity response matches its entry in the listing
         """
-        # Arrange: Get activities fixture
-        
-        # Act & Assert: Check participant count vs max for each activity
-        for activity_name, details in available_activities.items():
-            current_count = len(details["participants"])
-            max_count = details["max_participants"]
-            
-            assert current_count <= max_count, \
-                f"Activity '{activity_name}' has {current_count} participants " \
-                f"but max is {max_count}"
+        # Arrange: Build one request per activity plus the full listing
+        names = list(available_activities)
+
+        # Act: Issue all reads concurrently on the shared event loop
+        listing, *details = await asyncio.gather(
+            async_test_client.get("/activities"),
+            *(async_test_client.get(f"/activities/{name}") for name in names),
+        )
+
+        # Assert: Every response succeeded and is consistent with the listing
+        assert listing.status_code == 200
+        assert all(r.status_code == 200 for r in details)
+        listed = listing.json()
+        for name, response in zip(names, details):
+            assert response.json() == listed[name]
@@ -0,0 +1,57 @@
+"""
+Performance micro-harness for the /activities endpoint
+
+Every backend test drives GET /activities (directly or via fixtures), so a
+regression in its serialization path slows the whole suite. This module
+measures warm, steady-state latency with timeit.repeat and gates on the
+median. It is opt-in: run with `pytest -m perf` (normal runs deselect it
+via the addopts in pytest.ini).
+"""
+
+import statistics
+import timeit
+
+import pytest
+
+# Requests per timing sample and number of samples to collect; repeat
+# lets the fastest samples dominate so one-off scheduler noise is ignored
+REQUESTS_PER_SAMPLE = 200
+SAMPLES = 5
+
+# Generous per-request budget: catches order-of-magnitude regressions in
+# routing/serialization without flaking on slow CI machines
+MEDIAN_THRESHOLD_SECONDS = 0.05
+
+
+@pytest.mark.perf
+def test_activities_endpoint_latency(test_client):
+    """
+    Test that warm /activities requests stay under the latency budget
+
+    Validates:
+    - Median per-request latency is below MEDIAN_THRESHOLD_SECONDS
+    - Prints the measured distribution for inspection with pytest -s
+    """
+    # Arrange: warm the client/route so import and first-request costs
+    # don't pollute the steady-state measurement
+    test_client.get("/activities")
+
+    # Act: Collect repeated timing samples of a tight request loop
+    timings = timeit.repeat(
+        lambda: test_client.get("/activities"),
+        number=REQUESTS_PER_SAMPLE,
+        repeat=SAMPLES,
+    )
+    per_request = [t / REQUESTS_PER_SAMPLE for t in timings]
+    median = statistics.median(per_request)
+
+    # Report the distribution (visible with pytest -s / on failure)
+    print(
+        f"/activities per-request latency: "
+        f"median={median * 1e6:.0f}us "
+        f"min={min(per_request) * 1e6:.0f}us "
+        f"max={max(per_request) * 1e6:.0f}us"
+    )
+
+    # Assert: Gate on the median so a single slow sample doesn't flake
+    assert median < MEDIAN_THRESHOLD_SECONDS
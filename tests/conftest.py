@@ -0,0 +1,30 @@
+"""
+Shared test configuration for the whole test suite
+
+The app keeps its activities in a module-level dict, so any signup or
+unregister performed by one test is visible to the next. The autouse
+fixture here snapshots and restores that dict around every test in the
+suite, which keeps tests order-independent and is what makes parallel
+runs with pytest-xdist safe.
+"""
+
+import copy
+
+import pytest
+from src import app as app_module
+
+
+@pytest.fixture(autouse=True)
+def _restore_activities():
+    """
+    Snapshots the in-memory activities store and restores it after each test
+
+    Deep-copying the dict around each test is far cheaper than rebuilding
+    the client, and keeps every test starting from the seeded data.
+    """
+    saved = copy.deepcopy(app_module.activities)
+    yield
+    app_module.activities.clear()
+    app_module.activities.update(saved)
+    # The restore bypasses the API, so drop the cached /activities bytes
+    app_module._invalidate_activities_cache()